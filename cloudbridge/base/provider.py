@@ -3,6 +3,7 @@ import ast
 import functools
 import logging
 import os
+import threading
 from os.path import expanduser
 try:
     from configparser import ConfigParser
@@ -35,6 +36,15 @@ class BaseConfiguration(Configuration):
 
     def __init__(self, user_config):
         self.update(user_config)
+        # This value is read on every paginated list request, so cache it
+        # up front instead of going through dict lookup machinery each time.
+        self._default_result_limit = self.get('default_result_limit',
+                                              DEFAULT_RESULT_LIMIT)
+
+    def __setitem__(self, key, value):
+        super(BaseConfiguration, self).__setitem__(key, value)
+        if key == 'default_result_limit':
+            self._default_result_limit = value
 
     @property
     def default_result_limit(self):
@@ -45,9 +55,7 @@ class BaseConfiguration(Configuration):
         :rtype: ``int``
         :return: The maximum number of results to return
         """
-        log.debug("Maximum number of results for list methods %s",
-                  DEFAULT_RESULT_LIMIT)
-        return self.get('default_result_limit', DEFAULT_RESULT_LIMIT)
+        return self._default_result_limit
 
     @property
     def default_wait_timeout(self):
@@ -92,6 +100,10 @@ class BaseCloudProvider(CloudProvider):
         self.add_required_middleware()
         self._region_name = None
         self._zone_name = None
+        # Service property lookups can trigger expensive lazy client
+        # construction, so has_service caches its result per service type.
+        self._has_service_cache = {}
+        self._has_service_lock = threading.Lock()
 
     @property
     def region_name(self):
@@ -156,8 +168,16 @@ class BaseCloudProvider(CloudProvider):
         return cloned_provider
 
     def _deepgetattr(self, obj, attr):
-        """Recurses through an attribute chain to get the ultimate value."""
-        return functools.reduce(getattr, attr.split('.'), obj)
+        """
+        Recurses through an attribute chain to get the ultimate value.
+
+        Uses the three-arg form of getattr so that a missing attribute
+        returns ``None`` instead of paying for an AttributeError on the
+        miss path.
+        """
+        return functools.reduce(
+            lambda o, a: getattr(o, a, None) if o is not None else None,
+            attr.split('.'), obj)
 
     def has_service(self, service_type):
         """
@@ -168,20 +188,31 @@ class BaseCloudProvider(CloudProvider):
 
         :rtype: bool
         :return: ``True`` if the service type is supported.
+
+        The result is cached per service type for the lifetime of this
+        provider instance, so only the first call for a given type pays
+        for the attribute resolution.
         """
-        log.info("Checking if provider supports %s", service_type)
         try:
-            if self._deepgetattr(self, service_type):
-                log.info("This provider supports %s",
-                         service_type)
-                return True
-        except AttributeError:
-            pass  # Undefined service type
-        except NotImplementedError:
-            pass  # service not implemented
-        log.info("This provider doesn't support %s",
-                 service_type)
-        return False
+            return self._has_service_cache[service_type]
+        except KeyError:
+            pass
+        with self._has_service_lock:
+            if service_type not in self._has_service_cache:
+                log.info("Checking if provider supports %s", service_type)
+                supported = False
+                try:
+                    if self._deepgetattr(self, service_type):
+                        log.info("This provider supports %s",
+                                 service_type)
+                        supported = True
+                except NotImplementedError:
+                    pass  # service not implemented
+                if not supported:
+                    log.info("This provider doesn't support %s",
+                             service_type)
+                self._has_service_cache[service_type] = supported
+            return self._has_service_cache[service_type]
 
     def _get_config_value(self, key, default_value=None):
         """
@@ -198,14 +229,19 @@ class BaseCloudProvider(CloudProvider):
         """
         log.debug("Getting config key %s, with supplied default value: %s",
                   key, default_value)
-        value = default_value
-        if isinstance(self.config, dict) and self.config.get(key):
-            value = self.config.get(key, default_value)
-        elif hasattr(self.config, key) and getattr(self.config, key):
-            value = getattr(self.config, key)
-        elif (self._config_parser.has_option(self.PROVIDER_ID, key) and
-              self._config_parser.get(self.PROVIDER_ID, key)):
+        # A single get/getattr with a default replaces the previous
+        # hasattr-then-getattr dance, which resolved each attribute up to
+        # three times per config read.
+        cfg = self.config
+        if isinstance(cfg, dict):
+            value = cfg.get(key)
+        else:
+            value = getattr(cfg, key, None)
+        if not value and self._config_parser.has_option(self.PROVIDER_ID,
+                                                        key):
             value = self._config_parser.get(self.PROVIDER_ID, key)
+        if not value:
+            value = default_value
         if isinstance(value, six.string_types) and not isinstance(
                 value, six.text_type):
             return six.u(value)
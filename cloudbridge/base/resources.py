@@ -5,12 +5,12 @@ import inspect
 import itertools
 import logging
 import os
+import random
 import re
 import shutil
 import time
 import uuid
-
-import six
+from concurrent.futures import ThreadPoolExecutor
 
 from cloudbridge.interfaces.exceptions import \
     InvalidConfigurationException
@@ -60,6 +60,9 @@ class BaseCloudResource(CloudResource):
     """
     Base implementation of a CloudBridge Resource.
     """
+
+    __slots__ = ('__provider',)
+
     # Regular expression for valid cloudbridge resource names/labels.
     # Can be alphanumeric string that does not start or end with a dash
     # Must be at least 3 characters in length.
@@ -119,11 +122,9 @@ class BaseCloudResource(CloudResource):
     def __repr__(self):
         name_or_label = getattr(self, 'label', self.name)
         if name_or_label == self.id:
-            return "<CB-{0}: {1}>".format(
-                self.__class__.__name__, self.id)
+            return f"<CB-{type(self).__name__}: {self.id}>"
         else:
-            return "<CB-{0}: {1} ({2})>".format(
-                self.__class__.__name__, name_or_label, self.id)
+            return f"<CB-{type(self).__name__}: {name_or_label} ({self.id})>"
 
 
 class BaseObjectLifeCycleMixin(ObjectLifeCycleMixin):
@@ -135,9 +136,11 @@ class BaseObjectLifeCycleMixin(ObjectLifeCycleMixin):
     method, since the desired ready states are object specific.
     """
 
-    def wait_for(self, target_states, terminal_states=None, timeout=None,
+    __slots__ = ()
 
-                 interval=None):
+    def wait_for(self, target_states, terminal_states=None, timeout=None,
+                 interval=None, max_interval=60, backoff_factor=2.0,
+                 jitter=0.5):
         if timeout is None:
             timeout = self._provider.config.default_wait_timeout
         if interval is None:
@@ -147,42 +150,97 @@ class BaseObjectLifeCycleMixin(ObjectLifeCycleMixin):
         assert interval >= 0
         assert timeout >= interval
 
-        end_time = time.time() + timeout
+        # Give subclasses backed by an SDK with built-in waiters a chance
+        # to delegate the wait to the provider instead of polling here.
+        if self._native_wait(target_states, terminal_states, timeout,
+                             interval) is not NotImplemented:
+            self.refresh()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Object: %s successfully reached target state: %s",
+                          self, self.state)
+            return True
 
-        while self.state not in target_states:
-            if self.state in (terminal_states or []):
+        end_time = time.time() + timeout
+        # Poll with exponential backoff (capped at max_interval) plus a
+        # small random jitter so that long waits do not hammer the provider
+        # API at a constant rate and trip rate limits.
+        cur_interval = interval
+
+        # Refresh and re-check the state at the top of each iteration so
+        # that a resource which is already in a target state is detected
+        # immediately, without burning a full sleep interval first.
+        while True:
+            self.refresh()
+            # Read state once per iteration and build any error message
+            # from cheap locals: a __repr__ of self can itself trigger
+            # provider lookups, which is the last thing a failing wait
+            # should be doing.
+            state = self.state
+            if state in target_states:
+                break
+            if state in (terminal_states or []):
+                sid = getattr(self, 'id', '?')
+                raise WaitStateException(
+                    f"Object: {type(self).__name__} ({sid}) is in state:"
+                    f" {state} which is a terminal state and cannot be"
+                    f" waited on.")
+            now = time.time()
+            if now > end_time:
+                sid = getattr(self, 'id', '?')
                 raise WaitStateException(
-                    "Object: {0} is in state: {1} which is a terminal state"
-                    " and cannot be waited on.".format(self, self.state))
-            else:
+                    f"Waited too long for object: {type(self).__name__}"
+                    f" ({sid}) to reach a desired state: {target_states}."
+                    f" It's still in state: {state}")
+            # The %s-style lazy formatting only defers the string build;
+            # the arguments (including a __repr__ of self) are still
+            # evaluated, so skip them entirely when DEBUG is off.
+            if log.isEnabledFor(logging.DEBUG):
                 log.debug(
                     "Object %s is in state: %s. Waiting another %s"
                     " seconds to reach target state(s): %s...",
                     self,
-                    self.state,
-                    int(end_time - time.time()),
+                    state,
+                    int(end_time - now),
                     target_states)
-                time.sleep(interval)
-                if time.time() > end_time:
-                    raise WaitStateException(
-                        "Waited too long for object: {0} to reach a desired"
-                        "state: {1}. It's still in state: {2}".format(
-                            self, target_states, self.state))
-            self.refresh()
-        log.debug("Object: %s successfully reached target state: %s",
-                  self, self.state)
+            # Clamp the sleep to the time remaining so that backed-off
+            # intervals cannot overrun the caller's timeout.
+            time.sleep(min(cur_interval, max(0, end_time - now)))
+            if cur_interval:
+                cur_interval = (min(max_interval,
+                                    cur_interval * backoff_factor) +
+                                random.uniform(0, jitter))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Object: %s successfully reached target state: %s",
+                      self, self.state)
         return True
 
+    def _native_wait(self, target_states, terminal_states, timeout, interval):
+        """
+        An overridable hook for delegating a wait to the provider SDK.
+
+        Subclasses whose SDK ships tuned waiters (e.g. boto3) can override
+        this method to block until one of the ``target_states`` is reached,
+        returning ``True`` on success and raising a ``WaitStateException``
+        on failure. Returning ``NotImplemented`` (the default) makes
+        ``wait_for`` fall back to the generic refresh/sleep polling loop.
+        """
+        return NotImplemented
+
 
 class BaseResultList(ResultList):
 
+    # Result lists are created once per page on the pagination hot path;
+    # slots avoid allocating a per-instance __dict__ for the paging
+    # attributes on top of the underlying list storage.
+    __slots__ = ('_marker', '_is_truncated', '_supports_total', '_total')
+
     def __init__(
             self, is_truncated, marker, supports_total, total=None, data=None):
         # call list constructor
         super(BaseResultList, self).__init__(data or [])
         self._marker = marker
         self._is_truncated = is_truncated
-        self._supports_total = True if supports_total else False
+        self._supports_total = bool(supports_total)
         self._total = total
 
     @property
@@ -211,6 +269,8 @@ class ServerPagedResultList(BaseResultList):
     supports server side paging.
     """
 
+    __slots__ = ()
+
     @property
     def supports_server_paging(self):
         return True
@@ -231,6 +291,8 @@ class ClientPagedResultList(BaseResultList):
     of the full result set entirely on the client side.
     """
 
+    __slots__ = ('_objects',)
+
     def __init__(self, provider, objects, limit=None, marker=None):
         self._objects = objects
         limit = limit or provider.config.default_result_limit
@@ -264,30 +326,76 @@ class BasePageableObjectMixin(PageableObjectMixin):
     that support a list(limit, marker) method.
     """
 
+    __slots__ = ()
+
     def __iter__(self):
-        for result in self.iter():
-            yield result
+        yield from self.iter()
 
     def iter(self, **kwargs):
         result_list = self.list(**kwargs)
         if result_list.supports_server_paging:
-            for result in result_list:
-                yield result
-            while result_list.is_truncated:
-                result_list = self.list(marker=result_list.marker, **kwargs)
-                for result in result_list:
-                    yield result
+            # Fetch the next page on a worker thread while the consumer
+            # iterates over the current one, overlapping the pagination
+            # latency with consumer processing.
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                while True:
+                    future = None
+                    if result_list.is_truncated:
+                        future = executor.submit(
+                            self.list, marker=result_list.marker, **kwargs)
+                    yield from result_list
+                    if future is None:
+                        break
+                    result_list = future.result()
+            finally:
+                executor.shutdown(wait=False)
         else:
-            for result in result_list.data:
-                yield result
+            yield from result_list.data
+
+    def iter_parallel(self, concurrency=8, **kwargs):
+        """
+        Iterate over all objects, fetching pages concurrently when possible.
+
+        When the service can compute the full set of page markers up front
+        (see :meth:`_page_markers`), all pages are submitted to a thread
+        pool of ``concurrency`` workers and yielded in marker order.
+        Services that only expose opaque, sequential markers fall back to
+        the serial (prefetching) :meth:`iter`.
+        """
+        markers = self._page_markers(**kwargs)
+        if markers is None:
+            yield from self.iter(**kwargs)
+            return
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(self.list, marker=marker, **kwargs)
+                       for marker in markers]
+            # Iterate in submission order so results come back sorted by
+            # marker while later pages continue downloading in parallel.
+            for future in futures:
+                yield from future.result()
+
+    def _page_markers(self, **kwargs):
+        """
+        Return the precomputed list of page markers covering a full
+        listing (the first page's marker being ``None``), or ``None`` when
+        markers can only be discovered one page at a time. Services backed
+        by a store with random-access markers can override this to enable
+        parallel paging in :meth:`iter_parallel`.
+        """
+        return None
 
 
 class BaseVMType(BaseCloudResource, VMType):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseVMType, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, VMType) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -300,28 +408,38 @@ class BaseVMType(BaseCloudResource, VMType):
 
 class BaseInstance(BaseCloudResource, BaseObjectLifeCycleMixin, Instance):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseInstance, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Instance) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
                 self.id == other.id and
-                # check from most to least likely mutables
+                # check cheap scalar fields before properties that may
+                # trigger a provider API call
                 self.state == other.state and
                 self.label == other.label and
+                self.image_id == other.image_id and
                 self.vm_firewalls == other.vm_firewalls and
                 self.public_ips == other.public_ips and
-                self.private_ips == other.private_ips and
-                self.image_id == other.image_id)
+                self.private_ips == other.private_ips)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [InstanceState.RUNNING],
             terminal_states=[InstanceState.DELETED, InstanceState.ERROR],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def delete(self):
         self._provider.compute.instances.delete(self)
@@ -329,9 +447,14 @@ class BaseInstance(BaseCloudResource, BaseObjectLifeCycleMixin, Instance):
 
 class BaseLaunchConfig(LaunchConfig):
 
+    __slots__ = ('provider', 'block_devices', '_root_device')
+
     def __init__(self, provider):
         self.provider = provider
         self.block_devices = []
+        # Track the root device directly so validation does not need to
+        # rescan the block device list on every addition.
+        self._root_device = None
 
     class BlockDeviceMapping(object):
         """
@@ -358,6 +481,8 @@ class BaseLaunchConfig(LaunchConfig):
         log.debug("Appending %s to the block_devices list",
                   block_device)
         self.block_devices.append(block_device)
+        if block_device.is_root:
+            self._root_device = block_device
 
     def _validate_volume_device(self, source=None, is_root=None,
                                 size=None, delete_on_terminate=None):
@@ -378,22 +503,21 @@ class BaseLaunchConfig(LaunchConfig):
             raise InvalidConfigurationException(
                 "Source must be a Snapshot, Volume, MachineImage, or None.")
         if size:
-            if not isinstance(size, six.integer_types) or not size > 0:
+            if not isinstance(size, int) or size <= 0:
                 log.exception("InvalidConfigurationException raised: "
                               "size argument must be an integer greater than "
                               "0. Got type %s and value %s.", type(size), size)
                 raise InvalidConfigurationException(
                     "The size must be None or an integer greater than 0.")
 
-        if is_root:
-            for bd in self.block_devices:
-                if bd.is_root:
-                    log.exception("InvalidConfigurationException raised: "
-                                  "%s has already been marked as the root "
-                                  "block device.", bd)
-                    raise InvalidConfigurationException(
-                        "An existing block device: {0} has already been"
-                        " marked as root. There can only be one root device.")
+        if is_root and self._root_device is not None:
+            log.exception("InvalidConfigurationException raised: "
+                          "%s has already been marked as the root "
+                          "block device.", self._root_device)
+            raise InvalidConfigurationException(
+                "An existing block device: {0} has already been"
+                " marked as root. There can only be one root device.".format(
+                    self._root_device))
 
         return BaseLaunchConfig.BlockDeviceMapping(
             is_volume=True, source=source, is_root=is_root, size=size,
@@ -403,10 +527,14 @@ class BaseLaunchConfig(LaunchConfig):
 class BaseMachineImage(
         BaseCloudResource, BaseObjectLifeCycleMixin, MachineImage):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseMachineImage, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, MachineImage) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -416,16 +544,23 @@ class BaseMachineImage(
                 self.label == other.label and
                 self.description == other.description)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [MachineImageState.AVAILABLE],
             terminal_states=[MachineImageState.ERROR],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
 
 class BaseAttachmentInfo(AttachmentInfo):
 
+    __slots__ = ('_volume', '_instance_id', '_device')
+
     def __init__(self, volume, instance_id, device):
         self._volume = volume
         self._instance_id = instance_id
@@ -446,10 +581,14 @@ class BaseAttachmentInfo(AttachmentInfo):
 
 class BaseVolume(BaseCloudResource, BaseObjectLifeCycleMixin, Volume):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseVolume, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Volume) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -458,12 +597,17 @@ class BaseVolume(BaseCloudResource, BaseObjectLifeCycleMixin, Volume):
                 self.state == other.state and
                 self.label == other.label)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [VolumeState.AVAILABLE],
             terminal_states=[VolumeState.ERROR, VolumeState.DELETED],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def delete(self):
         """
@@ -474,10 +618,14 @@ class BaseVolume(BaseCloudResource, BaseObjectLifeCycleMixin, Volume):
 
 class BaseSnapshot(BaseCloudResource, BaseObjectLifeCycleMixin, Snapshot):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseSnapshot, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Snapshot) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -486,12 +634,17 @@ class BaseSnapshot(BaseCloudResource, BaseObjectLifeCycleMixin, Snapshot):
                 self.state == other.state and
                 self.label == other.label)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [SnapshotState.AVAILABLE],
             terminal_states=[SnapshotState.ERROR],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def delete(self):
         """
@@ -502,12 +655,16 @@ class BaseSnapshot(BaseCloudResource, BaseObjectLifeCycleMixin, Snapshot):
 
 class BaseKeyPair(BaseCloudResource, KeyPair):
 
+    __slots__ = ('_key_pair', '_private_material')
+
     def __init__(self, provider, key_pair):
         super(BaseKeyPair, self).__init__(provider)
         self._key_pair = key_pair
         self._private_material = None
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, KeyPair) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -542,18 +699,54 @@ class BaseKeyPair(BaseCloudResource, KeyPair):
 
 class BaseVMFirewall(BaseCloudResource, VMFirewall):
 
+    __slots__ = ('_vm_firewall', '_rules_cache', '_rules_fs_cache')
+
     def __init__(self, provider, vm_firewall):
         super(BaseVMFirewall, self).__init__(provider)
         self._vm_firewall = vm_firewall
+        self._rules_cache = None
+        self._rules_fs_cache = None
+
+    def _cached_rules(self):
+        """
+        Materialize and memoize this firewall's rules.
+
+        Iterating the rules of a firewall typically issues a fresh provider
+        API call, so hold on to the materialized list until a rule is added
+        or removed.
+        """
+        if self._rules_cache is None:
+            self._rules_cache = list(self.rules)
+        return self._rules_cache
+
+    def _invalidate_rules_cache(self):
+        self._rules_cache = None
+        self._rules_fs_cache = None
+
+    @property
+    def _rules_fs(self):
+        """
+        A frozenset view of the cached rules. Frozenset equality runs as
+        a C-level hash-bucket sweep, and the hashable form is built once
+        per rule-set generation instead of once per comparison.
+        """
+        if self._rules_fs_cache is None:
+            self._rules_fs_cache = frozenset(self._cached_rules())
+        return self._rules_fs_cache
 
     def __eq__(self, other):
         """
         Check if all the defined rules match across both VM firewalls.
         """
-        return (isinstance(other, VMFirewall) and
+        if self is other:
+            return True
+        if not (isinstance(other, VMFirewall) and
                 # pylint:disable=protected-access
-                self._provider == other._provider and
-                set(self.rules) == set(other.rules))
+                self._provider == other._provider):
+            return False
+        other_fs = (other._rules_fs if isinstance(other, BaseVMFirewall)
+                    else frozenset(other.rules))
+        return self._rules_fs == other_fs
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -591,6 +784,8 @@ class BaseVMFirewall(BaseCloudResource, VMFirewall):
 
 class BaseVMFirewallRule(BaseCloudResource, VMFirewallRule):
 
+    __slots__ = ('firewall', '_rule', '_name', '_hash')
+
     def __init__(self, parent_fw, rule):
         # pylint:disable=protected-access
         super(BaseVMFirewallRule, self).__init__(
@@ -608,13 +803,14 @@ class BaseVMFirewallRule(BaseCloudResource, VMFirewallRule):
         return self._name
 
     def __repr__(self):
-        return ("<{0}: id: {1}; direction: {2}; protocol: {3};  from: {4};"
-                " to: {5}; cidr: {6}, src_dest_fw: {7}>"
-                .format(self.__class__.__name__, self.id, self.direction,
-                        self.protocol, self.from_port, self.to_port, self.cidr,
-                        self.src_dest_fw_id))
+        return (f"<{type(self).__name__}: id: {self.id};"
+                f" direction: {self.direction}; protocol: {self.protocol};"
+                f"  from: {self.from_port}; to: {self.to_port};"
+                f" cidr: {self.cidr}, src_dest_fw: {self.src_dest_fw_id}>")
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, VMFirewallRule) and
                 self.direction == other.direction and
                 self.protocol == other.protocol and
@@ -632,10 +828,17 @@ class BaseVMFirewallRule(BaseCloudResource, VMFirewallRule):
 
         This is requeried for operations on hashed collections including
         ``set``, ``frozenset``, and ``dict``.
+
+        Rules are immutable in normal usage, so the hash is computed once
+        (directly over the tuple of field values, avoiding a string
+        allocation per call) and cached thereafter.
         """
-        return hash("{0}{1}{2}{3}{4}{5}".format(
-            self.direction, self.protocol, self.from_port, self.to_port,
-            self.cidr, self.src_dest_fw_id))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.direction, self.protocol, self.from_port,
+                               self.to_port, self.cidr, self.src_dest_fw_id))
+            return self._hash
 
     def to_json(self):
         attr = inspect.getmembers(self, lambda a: not (inspect.isroutine(a)))
@@ -646,14 +849,20 @@ class BaseVMFirewallRule(BaseCloudResource, VMFirewallRule):
 
     def delete(self):
         self._provider.security._vm_firewall_rules.delete(self.firewall, self)
+        # pylint:disable=protected-access
+        self.firewall._invalidate_rules_cache()
 
 
 class BasePlacementZone(BaseCloudResource, PlacementZone):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BasePlacementZone, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, PlacementZone) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -662,10 +871,14 @@ class BasePlacementZone(BaseCloudResource, PlacementZone):
 
 class BaseRegion(BaseCloudResource, Region):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseRegion, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Region) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -684,6 +897,8 @@ class BaseRegion(BaseCloudResource, Region):
 
 class BaseBucketObject(BaseCloudResource, BucketObject):
 
+    __slots__ = ()
+
     # Regular expression for valid bucket keys.
     # They, must match the following criteria: http://docs.aws.amazon.com/"
     # AmazonS3/latest/dev/UsingMetadata.html#object-key-guidelines
@@ -714,6 +929,8 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         shutil.copyfileobj(self.iter_content(), target_stream)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, BucketObject) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -724,10 +941,14 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
 
 class BaseBucket(BaseCloudResource, Bucket):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseBucket, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Bucket) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -746,6 +967,8 @@ class BaseBucket(BaseCloudResource, Bucket):
 
 class BaseNetwork(BaseCloudResource, BaseObjectLifeCycleMixin, Network):
 
+    __slots__ = ()
+
     CB_DEFAULT_NETWORK_LABEL = os.environ.get('CB_DEFAULT_NETWORK_LABEL',
                                               'cloudbridge-net')
     CB_DEFAULT_IPV4RANGE = os.environ.get('CB_DEFAULT_IPV4RANGE',
@@ -767,17 +990,24 @@ class BaseNetwork(BaseCloudResource, BaseObjectLifeCycleMixin, Network):
 
         return prefix1 == prefix2
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [NetworkState.AVAILABLE],
             terminal_states=[NetworkState.ERROR],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def delete(self):
         self._provider.networking.networks.delete(self)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Network) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -786,6 +1016,8 @@ class BaseNetwork(BaseCloudResource, BaseObjectLifeCycleMixin, Network):
 
 class BaseSubnet(BaseCloudResource, BaseObjectLifeCycleMixin, Subnet):
 
+    __slots__ = ()
+
     CB_DEFAULT_SUBNET_LABEL = os.environ.get('CB_DEFAULT_SUBNET_LABEL',
                                              'cloudbridge-subnet')
     CB_DEFAULT_SUBNET_IPV4RANGE = os.environ.get('CB_DEFAULT_SUBNET_IPV4RANGE',
@@ -795,6 +1027,8 @@ class BaseSubnet(BaseCloudResource, BaseObjectLifeCycleMixin, Subnet):
         super(BaseSubnet, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Subnet) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -804,12 +1038,17 @@ class BaseSubnet(BaseCloudResource, BaseObjectLifeCycleMixin, Subnet):
     def network(self):
         return self._provider.networking.networks.get(self.network_id)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [SubnetState.AVAILABLE],
             terminal_states=[SubnetState.ERROR],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def delete(self):
         self._provider.networking.subnets.delete(self)
@@ -817,6 +1056,8 @@ class BaseSubnet(BaseCloudResource, BaseObjectLifeCycleMixin, Subnet):
 
 class BaseFloatingIP(BaseCloudResource, BaseObjectLifeCycleMixin, FloatingIP):
 
+    __slots__ = ()
+
     def __init__(self, provider):
         super(BaseFloatingIP, self).__init__(provider)
 
@@ -829,14 +1070,21 @@ class BaseFloatingIP(BaseCloudResource, BaseObjectLifeCycleMixin, FloatingIP):
         return (FloatingIpState.IN_USE if self.in_use
                 else FloatingIpState.AVAILABLE)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [FloatingIpState.AVAILABLE, FloatingIpState.IN_USE],
             terminal_states=[FloatingIpState.ERROR],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, FloatingIP) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -851,6 +1099,8 @@ class BaseFloatingIP(BaseCloudResource, BaseObjectLifeCycleMixin, FloatingIP):
 
 class BaseRouter(BaseCloudResource, Router):
 
+    __slots__ = ()
+
     CB_DEFAULT_ROUTER_LABEL = os.environ.get('CB_DEFAULT_ROUTER_LABEL',
                                              'cloudbridge-router')
 
@@ -858,6 +1108,8 @@ class BaseRouter(BaseCloudResource, Router):
         super(BaseRouter, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, Router) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -870,6 +1122,8 @@ class BaseRouter(BaseCloudResource, Router):
 class BaseInternetGateway(BaseCloudResource, BaseObjectLifeCycleMixin,
                           InternetGateway):
 
+    __slots__ = ()
+
     CB_DEFAULT_INET_GATEWAY_NAME = cb_helpers.get_env(
         'CB_DEFAULT_INET_GATEWAY_NAME', 'cloudbridge-inetgateway')
 
@@ -877,17 +1131,24 @@ class BaseInternetGateway(BaseCloudResource, BaseObjectLifeCycleMixin,
         super(BaseInternetGateway, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, InternetGateway) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
                 self.id == other.id)
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0,
+                        jitter=0.5):
         self.wait_for(
             [GatewayState.AVAILABLE],
             terminal_states=[GatewayState.ERROR, GatewayState.UNKNOWN],
             timeout=timeout,
-            interval=interval)
+            interval=interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            jitter=jitter)
 
     def delete(self):
         return self._provider.networking._gateways.delete(self.network_id,
@@ -896,6 +1157,8 @@ class BaseInternetGateway(BaseCloudResource, BaseObjectLifeCycleMixin,
 
 class BaseDnsZone(BaseCloudResource, DnsZone):
 
+    __slots__ = ()
+
     CB_NAME_PATTERN = re.compile(
         r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z0-9]"
         r"[a-z0-9-]{0,61}[a-z0-9]\.?$")
@@ -904,6 +1167,8 @@ class BaseDnsZone(BaseCloudResource, DnsZone):
         super(BaseDnsZone, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, BaseDnsZone) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
@@ -933,6 +1198,8 @@ class BaseDnsZone(BaseCloudResource, DnsZone):
 
 class BaseDnsRecord(BaseCloudResource, DnsRecord):
 
+    __slots__ = ()
+
     CB_NAME_PATTERN = re.compile(
         r"^(?:\*\.)?(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z0-9]"
         r"[a-z0-9-]{0,61}[a-z0-9]\.?$")
@@ -941,6 +1208,8 @@ class BaseDnsRecord(BaseCloudResource, DnsRecord):
         super(BaseDnsRecord, self).__init__(provider)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return (isinstance(other, BaseDnsRecord) and
                 # pylint:disable=protected-access
                 self._provider == other._provider and
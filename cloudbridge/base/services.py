@@ -2,6 +2,7 @@
 Base implementation for services available through a provider
 """
 import logging
+import time
 
 from cloudbridge.interfaces.exceptions import InvalidParamException
 from cloudbridge.interfaces.resources import DnsRecordType
@@ -214,17 +215,37 @@ class BaseVMTypeService(
     def __init__(self, provider):
         super(BaseVMTypeService, self).__init__(provider)
         self._service_event_pattern += ".compute.vm_types"
+        # The VM type catalog is effectively static per region, so lookups
+        # reuse a cached listing instead of re-fetching it every time.
+        self._list_cache = None
+        self._list_cache_ts = 0
+        self._list_cache_ttl = 3600
+
+    def _cached_list(self):
+        if (self._list_cache is None or
+                time.time() - self._list_cache_ts > self._list_cache_ttl):
+            self._list_cache = list(self.iter())
+            self._list_cache_ts = time.time()
+        return self._list_cache
+
+    def invalidate(self):
+        """
+        Discard the cached VM type listing so that the next lookup
+        re-fetches it from the provider.
+        """
+        self._list_cache = None
+        self._list_cache_ts = 0
 
     @dispatch(event="provider.compute.vm_types.get",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def get(self, vm_type_id):
-        vm_type = (t for t in self if t.id == vm_type_id)
+        vm_type = (t for t in self._cached_list() if t.id == vm_type_id)
         return next(vm_type, None)
 
     @dispatch(event="provider.compute.vm_types.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs):
-        obj_list = self
+        obj_list = self._cached_list()
         filters = ['name']
         matches = cb_helpers.generic_find(filters, kwargs, obj_list)
         return ClientPagedResultList(self._provider, list(matches))
@@ -85,21 +85,27 @@ class BaseVMFirewallRuleSubService(BasePageableObjectMixin,
 
     def create(self, direction, protocol=None, from_port=None,
                to_port=None, cidr=None, src_dest_fw=None):
-        return (self._provider
+        rule = (self._provider
                     .security
                     ._vm_firewall_rules
                     .create(self._firewall, direction, protocol, from_port,
                             to_port, cidr, src_dest_fw))
+        # pylint:disable=protected-access
+        self._firewall._invalidate_rules_cache()
+        return rule
 
     def find(self, **kwargs):
         return self._provider.security._vm_firewall_rules.find(self._firewall,
                                                                **kwargs)
 
     def delete(self, rule_id):
-        return (self._provider
-                    .security
-                    ._vm_firewall_rules
-                    .delete(self._firewall, rule_id))
+        result = (self._provider
+                      .security
+                      ._vm_firewall_rules
+                      .delete(self._firewall, rule_id))
+        # pylint:disable=protected-access
+        self._firewall._invalidate_rules_cache()
+        return result
 
 
 class BaseFloatingIPSubService(FloatingIPSubService, BasePageableObjectMixin):
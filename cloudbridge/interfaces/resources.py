@@ -41,6 +41,8 @@ class CloudResource(object):
     @name documentation. The label property is a user-assignable
     identifier for the resource.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -114,6 +116,8 @@ class CloudResource(object):
 
 class LabeledCloudResource(CloudResource):
 
+    __slots__ = ()
+
     @abstractproperty
     def label(self):
         """
@@ -218,6 +222,8 @@ class ObjectLifeCycleMixin(object):
     A ``refresh`` operation allows the object to synchronize its state with the
     service provider.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -335,6 +341,8 @@ class PageableObjectMixin(object):
     method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __iter__(self):
         """
@@ -424,6 +432,10 @@ class ResultList(list):
     """
     __metaclass__ = ABCMeta
 
+    # Keep instances __dict__-free so that slotted subclasses only pay
+    # for the list layout plus their declared attributes.
+    __slots__ = ()
+
     @abstractproperty
     def marker(self):
         """
@@ -505,6 +517,8 @@ class InstanceState(object):
 
 class Instance(ObjectLifeCycleMixin, LabeledCloudResource):
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -764,6 +778,8 @@ class LaunchConfig(object):
             'MyVM', image, vm_type, subnet, launch_config=lc)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def add_ephemeral_device(self):
         """
@@ -858,6 +874,8 @@ class LaunchConfig(object):
 
 class MachineImage(ObjectLifeCycleMixin, LabeledCloudResource):
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -916,6 +934,8 @@ class Network(ObjectLifeCycleMixin, LabeledCloudResource):
     """
     Represents a software-defined network, like the Virtual Private Cloud.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -1014,6 +1034,8 @@ class Subnet(ObjectLifeCycleMixin, LabeledCloudResource):
     """
     Represents a subnet, as part of a Network.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -1100,6 +1122,8 @@ class FloatingIP(ObjectLifeCycleMixin, CloudResource):
     """
     Represents a floating (i.e., static) IP address.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1166,6 +1190,8 @@ class Router(LabeledCloudResource):
     network cable to enable routing to/from that subnet. Attaching a gateway
     can be thought of as plugging in an upstream link.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -1289,6 +1315,8 @@ class Gateway(CloudResource):
     """
     Represents a gateway resource.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1324,6 +1352,8 @@ class InternetGateway(ObjectLifeCycleMixin, Gateway):
     """
     Represents an Internet gateway resource.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
 
@@ -1334,6 +1364,8 @@ class DnsZone(CloudResource):
     A host zone represents a top level domain (e.g. cloudve.org) in which
     multiple dns records (e.g. A, CNAME. MX etc.) are contained.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @property
@@ -1389,6 +1421,8 @@ class DnsRecord(CloudResource):
     A dns record belongs to a host zone and can contain
     records of varous types such as A, CNAME. MX etc.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1437,6 +1471,8 @@ class AttachmentInfo(object):
     Contains attachment information for a volume.
     """
 
+    __slots__ = ()
+
     @abstractproperty
     def volume(self):
         """
@@ -1495,6 +1531,8 @@ class Volume(ObjectLifeCycleMixin, LabeledCloudResource):
     Represents a block storage device (aka volume).
     """
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -1676,6 +1714,8 @@ class Snapshot(ObjectLifeCycleMixin, LabeledCloudResource):
     Represents a snapshot of a block storage device.
     """
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -1815,6 +1855,8 @@ class KeyPair(CloudResource):
     Represents an ssh key pair.
     """
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1845,6 +1887,8 @@ class Region(CloudResource):
     A cloud region is typically a separate geographic area and will contain at
     least one placement zone.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1864,6 +1908,8 @@ class PlacementZone(CloudResource):
 
     A placement zone is contained within a Region.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1881,6 +1927,8 @@ class VMType(CloudResource):
     """
     A VM type object.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -1976,6 +2024,8 @@ class VMFirewall(LabeledCloudResource):
     This is in contrast to a firewall for a network, for example.
     """
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @LabeledCloudResource.label.setter
@@ -2032,6 +2082,8 @@ class VMFirewallRule(CloudResource):
     """
     Represents a VM firewall rule.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -2118,6 +2170,8 @@ class BucketObject(CloudResource):
     """
     Represents an object stored within a bucket.
     """
+
+    __slots__ = ()
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -2238,6 +2292,8 @@ class Bucket(CloudResource):
     Represents a namespace for objects (eg, object store bucket or container).
     """
 
+    __slots__ = ()
+
     __metaclass__ = ABCMeta
 
     @abstractproperty
@@ -4,8 +4,10 @@ DataTypes used by this provider
 import hashlib
 import inspect
 import logging
+import time
 
 from botocore.exceptions import ClientError
+from botocore.exceptions import WaiterError
 
 import tenacity
 
@@ -30,6 +32,7 @@ from cloudbridge.base.resources import BaseVMFirewall
 from cloudbridge.base.resources import BaseVMFirewallRule
 from cloudbridge.base.resources import BaseVMType
 from cloudbridge.base.resources import BaseVolume
+from cloudbridge.interfaces.exceptions import WaitStateException
 from cloudbridge.interfaces.resources import GatewayState
 from cloudbridge.interfaces.resources import InstanceState
 from cloudbridge.interfaces.resources import MachineImageState
@@ -50,6 +53,52 @@ from .subservices import AWSVMFirewallRuleSubService
 log = logging.getLogger(__name__)
 
 
+# Number of waiter polls to run before re-checking for terminal states
+# that the waiter's own acceptors do not cover.
+_WAIT_CHUNK_ATTEMPTS = 6
+
+
+def _ec2_native_wait(resource, waiter_name, waiter_kwargs, terminal_states,
+                     timeout, interval):
+    """
+    Block on a built-in EC2 waiter, mapping its polling configuration and
+    failure mode to CloudBridge wait semantics.
+
+    The waiter's failure acceptors do not cover every state CloudBridge
+    treats as terminal (e.g. ``volume_available`` keeps retrying on an EC2
+    volume in ``error``), so the waiter is run in short chunks with a
+    ``terminal_states`` check in between to preserve fail-fast behavior.
+    """
+    delay = max(int(interval), 1)
+    terminal_states = terminal_states or []
+    # pylint:disable=protected-access
+    waiter = resource._provider.ec2_conn.meta.client.get_waiter(waiter_name)
+    end_time = time.time() + timeout
+    while True:
+        attempts = min(max(int((end_time - time.time()) // delay), 1),
+                       _WAIT_CHUNK_ATTEMPTS)
+        try:
+            waiter.wait(WaiterConfig={'Delay': delay,
+                                      'MaxAttempts': attempts},
+                        **waiter_kwargs)
+            return True
+        except WaiterError as e:
+            resource.refresh()
+            state = resource.state
+            if state in terminal_states:
+                raise WaitStateException(
+                    "Object: {0} ({1}) is in state: {2} which is a terminal"
+                    " state and cannot be waited on.".format(
+                        type(resource).__name__,
+                        getattr(resource, 'id', '?'), state))
+            if ('Max attempts exceeded' in e.kwargs.get('reason', '') and
+                    time.time() < end_time):
+                continue
+            raise WaitStateException(
+                "EC2 waiter {0} did not reach the desired state: {1}".format(
+                    waiter_name, e))
+
+
 class AWSMachineImage(BaseMachineImage):
     IMAGE_STATE_MAP = {
         'pending': MachineImageState.PENDING,
@@ -143,6 +192,19 @@ class AWSMachineImage(BaseMachineImage):
     def refresh(self):
         self._ec2_image.reload()
 
+    # EC2 waiters keyed by the exact set of target states they satisfy.
+    _NATIVE_WAITERS = {
+        frozenset([MachineImageState.AVAILABLE]): 'image_available',
+    }
+
+    def _native_wait(self, target_states, terminal_states, timeout, interval):
+        waiter_name = AWSMachineImage._NATIVE_WAITERS.get(
+            frozenset(target_states))
+        if not waiter_name:
+            return NotImplemented
+        return _ec2_native_wait(self, waiter_name, {'ImageIds': [self.id]},
+                                terminal_states, timeout, interval)
+
 
 class AWSPlacementZone(BasePlacementZone):
 
@@ -428,6 +490,20 @@ class AWSInstance(BaseInstance):
             # set the state to unknown
             self._unknown_state = True
 
+    # EC2 waiters keyed by the exact set of target states they satisfy.
+    _NATIVE_WAITERS = {
+        frozenset([InstanceState.RUNNING]): 'instance_running',
+        frozenset([InstanceState.STOPPED]): 'instance_stopped',
+        frozenset([InstanceState.DELETED]): 'instance_terminated',
+    }
+
+    def _native_wait(self, target_states, terminal_states, timeout, interval):
+        waiter_name = AWSInstance._NATIVE_WAITERS.get(frozenset(target_states))
+        if not waiter_name:
+            return NotImplemented
+        return _ec2_native_wait(self, waiter_name, {'InstanceIds': [self.id]},
+                                terminal_states, timeout, interval)
+
     # pylint:disable=unused-argument
     def _wait_till_exists(self, timeout=None, interval=None):
         self._ec2_instance.wait_until_exists()
@@ -577,6 +653,20 @@ class AWSVolume(BaseVolume):
             # set the status to unknown
             self._unknown_state = True
 
+    # EC2 waiters keyed by the exact set of target states they satisfy.
+    _NATIVE_WAITERS = {
+        frozenset([VolumeState.AVAILABLE]): 'volume_available',
+        frozenset([VolumeState.IN_USE]): 'volume_in_use',
+        frozenset([VolumeState.DELETED]): 'volume_deleted',
+    }
+
+    def _native_wait(self, target_states, terminal_states, timeout, interval):
+        waiter_name = AWSVolume._NATIVE_WAITERS.get(frozenset(target_states))
+        if not waiter_name:
+            return NotImplemented
+        return _ec2_native_wait(self, waiter_name, {'VolumeIds': [self.id]},
+                                terminal_states, timeout, interval)
+
 
 class AWSSnapshot(BaseSnapshot):
     # Ref: http://docs.aws.amazon.com/AWSEC2/latest/CommandLineReference/
@@ -664,6 +754,18 @@ class AWSSnapshot(BaseSnapshot):
             # set the status to unknown
             self._unknown_state = True
 
+    # EC2 waiters keyed by the exact set of target states they satisfy.
+    _NATIVE_WAITERS = {
+        frozenset([SnapshotState.AVAILABLE]): 'snapshot_completed',
+    }
+
+    def _native_wait(self, target_states, terminal_states, timeout, interval):
+        waiter_name = AWSSnapshot._NATIVE_WAITERS.get(frozenset(target_states))
+        if not waiter_name:
+            return NotImplemented
+        return _ec2_native_wait(self, waiter_name, {'SnapshotIds': [self.id]},
+                                terminal_states, timeout, interval)
+
     def create_volume(self, size=None, volume_type=None, iops=None):
         label = "from-snap-{0}".format(self.label or self.id)
         cb_vol = self._provider.storage.volumes.create(
@@ -737,6 +839,7 @@ class AWSVMFirewall(BaseVMFirewall):
 
     def refresh(self):
         self._vm_firewall.reload()
+        self._invalidate_rules_cache()
 
     def to_json(self):
         attr = inspect.getmembers(self, lambda a: not inspect.isroutine(a))
@@ -1014,7 +1117,9 @@ class AWSNetwork(BaseNetwork):
         self._vpc.wait_until_exists()
         self._vpc.wait_until_available()
 
-    def wait_till_ready(self, timeout=None, interval=None):
+    # pylint:disable=unused-argument
+    def wait_till_ready(self, timeout=None, interval=None,
+                        max_interval=60, backoff_factor=2.0, jitter=0.5):
         self._wait_for_vpc()
         self.refresh()
 
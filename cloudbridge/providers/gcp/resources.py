@@ -549,6 +549,7 @@ class GCPVMFirewall(BaseVMFirewall):
             self._network = fw._network
             # pylint:disable=protected-access
             self._rule_container = fw._rule_container
+            self._invalidate_rules_cache()
 
     @property
     def network(self):
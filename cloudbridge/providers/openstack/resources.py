@@ -1158,6 +1158,7 @@ class OpenStackVMFirewall(BaseVMFirewall):
     def refresh(self):
         self._vm_firewall = self._provider.os_conn.network.get_security_group(
             self.id)
+        self._invalidate_rules_cache()
 
     def to_json(self):
         attr = inspect.getmembers(self, lambda a: not(inspect.isroutine(a)))
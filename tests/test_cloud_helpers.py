@@ -3,6 +3,7 @@ import itertools
 import six
 
 from cloudbridge.base.helpers import get_env
+from cloudbridge.base.resources import BasePageableObjectMixin
 from cloudbridge.base.resources import ClientPagedResultList
 from cloudbridge.base.resources import ServerPagedResultList
 
@@ -19,6 +20,40 @@ class DummyResult(object):
         return "%s (%s)" % (self.id, self.name)
 
 
+class DummyPageableService(BasePageableObjectMixin):
+    """
+    A fake service that serves a canned object list in server-side pages,
+    using the start index of the next page as the marker.
+    """
+
+    def __init__(self, objects, page_size):
+        self._objects = objects
+        self._page_size = page_size
+        self.list_markers = []
+
+    def list(self, limit=None, marker=None):
+        self.list_markers.append(marker)
+        start = marker or 0
+        page = self._objects[start:start + self._page_size]
+        next_start = start + self._page_size
+        is_truncated = next_start < len(self._objects)
+        return ServerPagedResultList(
+            is_truncated=is_truncated,
+            marker=next_start if is_truncated else None,
+            supports_total=True, total=len(self._objects), data=page)
+
+
+class DummyRandomAccessService(DummyPageableService):
+    """
+    A variant whose page markers can all be computed up front, enabling
+    the parallel path of ``iter_parallel``.
+    """
+
+    def _page_markers(self, **kwargs):
+        return [None] + list(range(self._page_size, len(self._objects),
+                                   self._page_size))
+
+
 class CloudHelpersTestCase(ProviderTestBase):
 
     _multiprocess_can_split_ = True
@@ -79,6 +114,42 @@ class CloudHelpersTestCase(ProviderTestBase):
         with self.assertRaises(NotImplementedError):
             results.data
 
+    def test_iter_server_paging_order(self):
+        # iter() prefetches the next page on a worker thread but must
+        # still yield every object exactly once, in page order.
+        service = DummyPageableService(self.objects, page_size=2)
+        self.assertListEqual(list(service.iter()), self.objects)
+        self.assertListEqual(service.list_markers, [None, 2])
+
+        # Uneven final pages are not skipped or duplicated.
+        service = DummyPageableService(self.objects, page_size=3)
+        self.assertListEqual(list(service.iter()), self.objects)
+        self.assertListEqual(service.list_markers, [None, 3])
+
+        # __iter__ delegates to iter()
+        service = DummyPageableService(self.objects, page_size=2)
+        self.assertListEqual(list(service), self.objects)
+
+    def test_iter_parallel_serial_fallback(self):
+        # Without random-access page markers, iter_parallel must behave
+        # exactly like the serial iter().
+        service = DummyPageableService(self.objects, page_size=2)
+        self.assertIsNone(service._page_markers())
+        self.assertListEqual(list(service.iter_parallel()), self.objects)
+        self.assertListEqual(service.list_markers, [None, 2])
+
+    def test_iter_parallel_with_markers(self):
+        # With precomputed markers, pages are fetched concurrently but
+        # yielded in marker order.
+        service = DummyRandomAccessService(self.objects, page_size=2)
+        self.assertListEqual(list(service.iter_parallel(concurrency=2)),
+                             self.objects)
+        self.assertCountEqual(service.list_markers, [None, 2])
+
+        service = DummyRandomAccessService(self.objects, page_size=1)
+        self.assertListEqual(list(service.iter_parallel(concurrency=4)),
+                             self.objects)
+
     def test_type_validation(self):
         # Make sure internal type checking implementation properly sets types.
         self.provider.config['text_type_check'] = 'test-text'
@@ -1,4 +1,9 @@
+import unittest
+from unittest import mock
+
 from cloudbridge.base import helpers as cb_helpers
+from cloudbridge.base import resources as base_resources
+from cloudbridge.base.resources import BaseObjectLifeCycleMixin
 from cloudbridge.interfaces import VolumeState
 from cloudbridge.interfaces.exceptions import WaitStateException
 
@@ -6,6 +11,170 @@ from tests import helpers
 from tests.helpers import ProviderTestBase
 
 
+class DummyLifeCycleObject(BaseObjectLifeCycleMixin):
+    """
+    A fake lifecycle object that walks through a canned state sequence,
+    advancing one state per refresh() call.
+    """
+
+    def __init__(self, states):
+        self.id = 'dummy-obj'
+        self._pending_states = list(states)
+        self._state = None
+
+    @property
+    def state(self):
+        return self._state
+
+    def refresh(self):
+        if self._pending_states:
+            self._state = self._pending_states.pop(0)
+
+    def wait_till_ready(self, timeout=None, interval=None, max_interval=60,
+                        backoff_factor=2.0, jitter=0.5):
+        return self.wait_for(
+            ['ready'], timeout=timeout, interval=interval,
+            max_interval=max_interval, backoff_factor=backoff_factor,
+            jitter=jitter)
+
+
+class FakeClock(object):
+    """
+    Replaces the time module within wait_for so polling tests run
+    instantly. Each sleep advances the clock by the requested duration
+    plus a small overhead, mimicking the work done between sleeps.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds + 0.01
+
+
+class WaitForPollingTestCase(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_wait_for_backoff_growth_and_cap(self):
+        obj = DummyLifeCycleObject(['pending'] * 5 + ['ready'])
+        clock = FakeClock()
+        with mock.patch.object(base_resources, 'time', clock):
+            self.assertTrue(
+                obj.wait_for(['ready'], timeout=1000, interval=1,
+                             max_interval=4, backoff_factor=2.0, jitter=0))
+        # Sleeps double from the initial interval and cap at max_interval.
+        self.assertEqual(clock.sleeps, [1, 2, 4, 4, 4])
+
+    def test_wait_for_timeout_bound(self):
+        obj = DummyLifeCycleObject(['pending'] * 100)
+        clock = FakeClock()
+        with mock.patch.object(base_resources, 'time', clock):
+            with self.assertRaises(WaitStateException):
+                obj.wait_for(['ready'], timeout=10, interval=5)
+        # Backed-off sleeps are clamped to the remaining time, so the
+        # total sleep can never overrun the caller's timeout.
+        self.assertLessEqual(sum(clock.sleeps), 10)
+
+    def test_wait_for_delegates_to_native_wait(self):
+
+        class NativeWaitObject(DummyLifeCycleObject):
+
+            def __init__(self, states):
+                super(NativeWaitObject, self).__init__(states)
+                self.native_calls = []
+
+            def _native_wait(self, target_states, terminal_states, timeout,
+                             interval):
+                self.native_calls.append(
+                    (tuple(target_states), tuple(terminal_states or []),
+                     timeout, interval))
+                return True
+
+        obj = NativeWaitObject(['ready'])
+        self.assertTrue(obj.wait_for(['ready'], terminal_states=['error'],
+                                     timeout=10, interval=1))
+        self.assertEqual(obj.native_calls, [(('ready',), ('error',), 10, 1)])
+        # The native path still refreshes once so state is in sync.
+        self.assertEqual(obj.state, 'ready')
+
+
+class EC2NativeWaitTestCase(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def _aws_resources(self):
+        try:
+            from cloudbridge.providers.aws import resources as aws_resources
+        except ImportError:
+            self.skipTest("AWS provider dependencies are not installed")
+        return aws_resources
+
+    def _fake_resource(self, waiter, state):
+        resource = mock.Mock()
+        resource._provider.ec2_conn.meta.client.get_waiter.return_value = \
+            waiter
+        resource.state = state
+        return resource
+
+    def test_native_wait_fails_fast_on_uncovered_terminal_state(self):
+        aws_resources = self._aws_resources()
+        from botocore.exceptions import WaiterError
+
+        class FakeWaiter(object):
+
+            def __init__(self):
+                self.configs = []
+
+            def wait(self, WaiterConfig=None, **kwargs):
+                self.configs.append(WaiterConfig)
+                raise WaiterError('VolumeAvailable', 'Max attempts exceeded',
+                                  {})
+
+        # volume_available has no failure acceptor for the EC2 'error'
+        # state; the chunked wait must still raise within one chunk.
+        waiter = FakeWaiter()
+        resource = self._fake_resource(waiter, VolumeState.ERROR)
+        with self.assertRaises(WaitStateException):
+            # pylint:disable=protected-access
+            aws_resources._ec2_native_wait(
+                resource, 'volume_available', {'VolumeIds': ['vol-1']},
+                [VolumeState.ERROR], timeout=600, interval=5)
+        self.assertEqual(len(waiter.configs), 1)
+        self.assertEqual(waiter.configs[0]['MaxAttempts'],
+                         aws_resources._WAIT_CHUNK_ATTEMPTS)
+        resource.refresh.assert_called_once_with()
+
+    def test_native_wait_resumes_after_chunk(self):
+        aws_resources = self._aws_resources()
+        from botocore.exceptions import WaiterError
+
+        class FakeWaiter(object):
+
+            def __init__(self):
+                self.calls = 0
+
+            def wait(self, WaiterConfig=None, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    raise WaiterError('VolumeAvailable',
+                                      'Max attempts exceeded', {})
+
+        # A chunk expiring without a terminal state resumes waiting.
+        waiter = FakeWaiter()
+        resource = self._fake_resource(waiter, VolumeState.CREATING)
+        # pylint:disable=protected-access
+        self.assertTrue(aws_resources._ec2_native_wait(
+            resource, 'volume_available', {'VolumeIds': ['vol-1']},
+            [VolumeState.ERROR], timeout=600, interval=5))
+        self.assertEqual(waiter.calls, 2)
+
+
 class CloudObjectLifeCycleTestCase(ProviderTestBase):
 
     _multiprocess_can_split_ = True
@@ -142,6 +142,41 @@ class CloudSecurityServiceTestCase(ProviderTestBase):
                            create_fw_rule, cleanup_fw_rule,
                            skip_name_check=True)
 
+    @helpers.skipIfNoService(['security.vm_firewalls'])
+    def test_vm_firewall_rules_cache_invalidation(self):
+        label = 'cb-fwcache-{0}'.format(helpers.get_uuid())
+
+        subnet = helpers.get_or_create_default_subnet(self.provider)
+        net = subnet.network
+
+        fw = None
+        with cb_helpers.cleanup_action(lambda: fw.delete()):
+            fw = self.provider.security.vm_firewalls.create(
+                label=label, description=label, network=net.id)
+
+            # Repeated rule lookups reuse the memoized listing.
+            # pylint:disable=protected-access
+            baseline = fw._cached_rules()
+            self.assertIs(fw._cached_rules(), baseline)
+
+            # Creating a rule invalidates the cache so the new rule is
+            # picked up by subsequent comparisons.
+            rule = fw.rules.create(
+                direction=TrafficDirection.INBOUND, protocol='tcp',
+                from_port=2222, to_port=2222, cidr='0.0.0.0/0')
+            self.assertIsNone(fw._rules_cache)
+            self.assertIn(rule, fw._rules_fs)
+
+            # So does deleting one.
+            rule.delete()
+            self.assertIsNone(fw._rules_cache)
+            self.assertNotIn(rule, fw._rules_fs)
+
+            # And so does an explicit refresh.
+            fw._cached_rules()
+            fw.refresh()
+            self.assertIsNone(fw._rules_cache)
+
     @helpers.skipIfNoService(['security.vm_firewalls'])
     def test_vm_firewall_rule_properties(self):
         label = 'cb-propfwrule-{0}'.format(helpers.get_uuid())
@@ -85,3 +85,22 @@ class CloudVMTypeServiceTestCase(ProviderTestBase):
 
         sit.check_standard_behaviour(
                 self, self.provider.compute.vm_types, vm_type)
+
+    @helpers.skipIfNoService(['compute.vm_types'])
+    def test_vm_types_cache_invalidation(self):
+        svc = self.provider.compute.vm_types
+        # pylint:disable=protected-access
+        first = svc._cached_list()
+        # Repeated get/find lookups reuse the cached listing.
+        self.assertIs(svc._cached_list(), first)
+
+        # An explicit invalidate() forces a refetch on the next lookup.
+        svc.invalidate()
+        self.assertIsNone(svc._list_cache)
+        second = svc._cached_list()
+        self.assertIsNot(second, first)
+        self.assertListEqual([t.id for t in first], [t.id for t in second])
+
+        # So does the cache entry outliving its TTL.
+        svc._list_cache_ts -= (svc._list_cache_ttl + 1)
+        self.assertIsNot(svc._cached_list(), second)